@@ -1,21 +1,153 @@
 import datetime
+import hashlib
 import json
+import logging
 import os
 import re
+import threading
+import time
 import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
 
 import pyodbc
 from flask import Flask, jsonify, request
-from flask_cors import CORS
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.exceptions import BadRequest, InternalServerError, Conflict, Unauthorized, NotFound
 from flask_jwt_extended import (
     JWTManager, create_access_token, jwt_required, get_jwt_identity, get_jwt
 )
-from Core.OCEANAnalyzer import OceanAnalyzer, download_nltk_resources
-from Core.TextPreProcessor import TextPreprocessor
-from Core.TweetScraper import TwitterScraper
+from Core import AsyncTweetScraper
+from Core.TweetScraper import ScraperPool
 from Operation.User import User
 from Operation.Analysis import Analysis
+from Operation.ConnectionPool import ConnectionPool
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Flask's default serializer is pure Python and dominates response time on
+    the large analyze_profile payloads (tweets + per-tweet results + summary).
+    orjson serializes the same structures several times faster, so every
+    jsonify() call benefits without touching the handlers. Parsing goes
+    through orjson too, which speeds up request.get_json() on the large
+    tweet-array bodies posted to /analyze.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# Pre-compiled patterns - avoids per-request compile/cache-lookup overhead
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+_REDACTED_FIELDS = frozenset({'password', 'current_password', 'new_password'})
+# Common casings included so the hot path usually skips the .lower() call
+_TRUTHY = frozenset({'true', '1', 'yes', 'on', 'True', 'TRUE'})
+
+# CORS policy is static (single known origin), so the headers are precomputed
+# once instead of being matched against origin lists on every request
+_CORS_HEADERS = {
+    'Access-Control-Allow-Origin': 'http://localhost:3000',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization'
+}
+_BULLET_RE = re.compile(r'•\s+(.*?)(?=\n|$)')
+_SECTION_PATTERNS = {
+    "GENERAL_INSIGHTS": re.compile(
+        r"Based on the analyzed text, this personality profile reveals someone who:(.*?)(?=\n\nAdditional insights:|$)",
+        re.DOTALL),
+    "ADDITIONAL_INSIGHTS": re.compile(r"Additional insights:(.*?)(?=\n\nIn relationships|$)", re.DOTALL),
+    "RELATIONSHIP_INSIGHTS": re.compile(r"In relationships, this person likely:(.*?)(?=\n\nIn work environments|$)",
+                                        re.DOTALL),
+    "WORK_INSIGHTS": re.compile(r"In work environments, this person typically:(.*?)(?=\n\nNote:|$)", re.DOTALL)
+}
+
+
+class TokenBlacklist:
+    """
+    Bounded, TTL-expiring store of revoked JWT IDs.
+
+    A plain set grows for the process lifetime even though a revoked token
+    only matters until it expires. Entries are stored with the token's expiry
+    timestamp and dropped once the token would be rejected anyway, keeping
+    memory bounded and lookups O(1).
+    """
+
+    def __init__(self, default_ttl=3600, max_size=100000):
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()  # jti -> expiry timestamp
+        self._lock = threading.Lock()
+
+    def add(self, jti, expires_at=None):
+        """Blacklist a token ID until its expiry timestamp"""
+        if expires_at is None:
+            expires_at = time.time() + self.default_ttl
+        with self._lock:
+            self._purge()
+            self._entries[jti] = expires_at
+            self._entries.move_to_end(jti)
+
+    def __contains__(self, jti):
+        with self._lock:
+            expires_at = self._entries.get(jti)
+            if expires_at is None:
+                return False
+            if expires_at <= time.time():
+                del self._entries[jti]
+                return False
+            return True
+
+    def _purge(self):
+        """Drop expired entries and cap the table size (lock must be held)"""
+        now = time.time()
+        expired = [jti for jti, expires_at in self._entries.items() if expires_at <= now]
+        for jti in expired:
+            del self._entries[jti]
+        while len(self._entries) >= self.max_size:
+            self._entries.popitem(last=False)
+
+
+class RedisTokenBlacklist:
+    """
+    Redis-backed store of revoked JWT IDs.
+
+    Unlike the in-process TokenBlacklist, revocations survive restarts and
+    are shared across workers. Each key carries a TTL equal to the token's
+    remaining lifetime, so Redis expires entries on its own.
+    """
+
+    def __init__(self, client, default_ttl=3600):
+        self.client = client
+        self.default_ttl = default_ttl
+
+    def add(self, jti, expires_at=None):
+        """Blacklist a token ID until its expiry timestamp"""
+        if expires_at is None:
+            ttl = self.default_ttl
+        else:
+            ttl = max(int(expires_at - time.time()), 1)
+        self.client.setex(f"jti:{jti}", ttl, 1)
+
+    def __contains__(self, jti):
+        return self.client.exists(f"jti:{jti}") == 1
 
 
 class PersonaInsight:
@@ -23,15 +155,22 @@ class PersonaInsight:
 
     def __init__(self, jwt_secret_key='PersonaInsight', jwt_expires=datetime.timedelta(hours=1)):
 
+        # One-time logging setup. WARNING by default keeps the Core modules'
+        # info/debug chatter off the hot request path in production; turn the
+        # level down via logging config when diagnosing
+        logging.basicConfig(level=logging.WARNING)
+
         self.app = Flask(__name__)
 
-        CORS(self.app, resources={
-            r"/*": {
-                "origins": ["http://localhost:3000"],
-                "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-                "allow_headers": ["Content-Type", "Authorization"]
-            }
-        })
+        # Use the fast orjson serializer for all jsonify() responses when the
+        # package is installed; fall back to Flask's default otherwise
+        if orjson is not None:
+            self.app.json = OrjsonProvider(self.app)
+
+        # Static CORS handling: short-circuit preflights and attach the
+        # precomputed headers, instead of flask_cors inspecting every request
+        self.app.before_request(self._handle_cors_preflight)
+        self.app.after_request(self._apply_cors_headers)
 
         # Configure JWT
         self.app.config['JWT_SECRET_KEY'] = jwt_secret_key
@@ -47,9 +186,31 @@ class PersonaInsight:
         self.db_username = r'LATITUDE-7490\Owais'
         self.trusted_connection = True
 
+        # Shared connection pool - avoids a TCP + TDS login handshake per request
+        self.db_pool = ConnectionPool(
+            server=self.server,
+            database=self.database,
+            db_username=self.db_username,
+            trusted_connection=self.trusted_connection
+        )
+
         # Analysis components
         self.preprocessor = None
         self.ocean_analyzer = None
+        self._model_init_lock = threading.Lock()
+
+        # Long-lived browser pool - Chrome startup is multi-second, so
+        # scrapers are reused across requests instead of launched per call
+        self.scraper_pool = ScraperPool()
+
+        # Shared executor for scrape jobs. Selenium calls spend their time in
+        # browser I/O (which releases the GIL), so a thread pool lets several
+        # scrapes run in parallel while capping concurrent Chrome activity
+        self.scrape_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='scrape')
+
+        # Small executor for database writes that shouldn't hold a request
+        # hostage; requests wait a bounded time and then report 'pending'
+        self.db_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='db')
 
         # Register routes
         self._register_routes()
@@ -60,11 +221,52 @@ class PersonaInsight:
         # Add before_request handler for model initialization
         self.app.before_request(self.initialize_models)
 
-        self.token_blacklist = set()
+        # Revoked tokens expire out of the blacklist along with the token itself
+        self.token_blacklist = self._build_token_blacklist(int(jwt_expires.total_seconds()))
 
         # Add JWT callbacks
         self._register_jwt_callbacks()
 
+        # Short-TTL cache of per-user analysis lists - absorbs dashboard
+        # refresh bursts without a SELECT per poll
+        self._analyses_cache = OrderedDict()  # email -> (expires_at, analyses)
+        self._analyses_cache_lock = threading.Lock()
+        self._analyses_cache_ttl = 30
+
+        # Cache verified tokens so repeat requests skip signature verification
+        self._install_token_decode_cache()
+
+    def _build_token_blacklist(self, default_ttl):
+        """
+        Choose the token blocklist backend.
+
+        Uses Redis when the redis package is installed and REDIS_URL is set,
+        so revocations are shared across workers and survive restarts; falls
+        back to the in-process TokenBlacklist otherwise. Both expose the same
+        add/in interface, so callers don't care which is active.
+        """
+        redis_url = os.environ.get('REDIS_URL')
+        if redis is not None and redis_url:
+            try:
+                client = redis.Redis.from_url(redis_url)
+                client.ping()
+                return RedisTokenBlacklist(client, default_ttl=default_ttl)
+            except redis.RedisError as e:
+                print(f"Redis blocklist unavailable ({e}), using in-process blacklist")
+        return TokenBlacklist(default_ttl=default_ttl)
+
+    def _handle_cors_preflight(self):
+        """Answer OPTIONS preflights directly without dispatching to a view"""
+        if request.method == 'OPTIONS':
+            response = self.app.make_response(('', 204))
+            response.headers.update(_CORS_HEADERS)
+            return response
+
+    def _apply_cors_headers(self, response):
+        """Attach the precomputed CORS headers to every response"""
+        response.headers.update(_CORS_HEADERS)
+        return response
+
     def initialize_models(self):
         """Initialize the OCEAN analyzer before handling the first request."""
         # Skip initialization for static resources
@@ -72,56 +274,107 @@ class PersonaInsight:
             return
 
         # Only initialize if not already done
-        if self.preprocessor is None or self.ocean_analyzer is None:
+        if self.preprocessor is not None and self.ocean_analyzer is not None:
+            return
+
+        # Serialize initialization so concurrent first requests share one
+        # in-memory model instead of each loading a copy
+        with self._model_init_lock:
+            if self.preprocessor is not None and self.ocean_analyzer is not None:
+                return
+
+            # Imported here rather than at module level so the server process
+            # starts without paying the TensorFlow/NLTK import cost; the first
+            # request triggers it exactly once
+            from Core.OCEANAnalyzer import OceanAnalyzer, download_nltk_resources
+            from Core.TextPreProcessor import TextPreprocessor
+
             # Download NLTK resources
             download_nltk_resources()
 
             # Initialize the text preprocessor
-            self.preprocessor = TextPreprocessor()
+            preprocessor = TextPreprocessor()
 
             # Initialize the OCEAN analyzer
-            self.ocean_analyzer = OceanAnalyzer(self.preprocessor)
+            ocean_analyzer = OceanAnalyzer(preprocessor)
 
             # Try to load existing model first
-            model_loaded = self.ocean_analyzer.load_model()
+            model_loaded = ocean_analyzer.load_model()
 
             if not model_loaded:
                 print("OCEAN model not found. Training new model...")
-                ocean_df = self.ocean_analyzer.load_data('mypersonality_final.csv')
-                X_train, X_test, y_train, y_test = self.ocean_analyzer.prepare_data(ocean_df)
-                self.ocean_analyzer.train(X_train, y_train, X_test, y_test)
+                ocean_df = ocean_analyzer.load_data('mypersonality_final.csv')
+                X_train, X_test, y_train, y_test = ocean_analyzer.prepare_data(ocean_df)
+                ocean_analyzer.train(X_train, y_train, X_test, y_test)
             else:
                 print("Using pre-trained OCEAN model")
 
+            # Publish fully-initialized components only once ready
+            self.preprocessor = preprocessor
+            self.ocean_analyzer = ocean_analyzer
+
     def _register_routes(self):
         """Register all API routes with the Flask app"""
-        # Route definitions
+        # Handlers needing auth are decorated with @jwt_required() where they
+        # are defined, so registration is a single uniform pass
         routes = [
             ('/', ['GET'], self.index),
             ('/analyze', ['POST'], self.analyze_tweets),
             ('/api/add_user', ['POST'], self.add_user),
             ('/api/users/login', ['POST'], self.login_user),
-            ('/api/update_users', ['PUT'], self.update_user, True),  # JWT protected
-            ('/api/delete_user', ['DELETE'], self.delete_user, True),  # JWT protected
-            ('/api/check_token', ['GET'], self.check_token, True),  # JWT protected
+            ('/api/update_users', ['PUT'], self.update_user),
+            ('/api/delete_user', ['DELETE'], self.delete_user),
+            ('/api/check_token', ['GET'], self.check_token),
             ('/api/tweets/username/<username>', ['GET'], self.get_tweets_by_username),
-            ('/api/tweet'
-             's/url', ['GET'], self.get_tweets_by_url),
+            ('/api/tweets/url', ['GET'], self.get_tweets_by_url),
             ('/api/analyze_profile', ['GET'], self.analyze_profile),
             ('/api/profile_info', ['GET'], self.get_profile_info),
-            ('/api/logout', ['GET'], self.logout_user, True),
+            ('/api/logout', ['GET'], self.logout_user),
             ('/api/get_analysis_by_email', ['GET'], self.get_user_analyses)
         ]
 
-        # Register each route
-        for route_info in routes:
-            if len(route_info) == 3:
-                route, methods, handler = route_info
-                self.app.route(route, methods=methods)(handler)
-            elif len(route_info) == 4:
-                route, methods, handler, jwt_protected = route_info
-                if jwt_protected:
-                    self.app.route(route, methods=methods)(jwt_required()(handler))
+        for route, methods, handler in routes:
+            self.app.add_url_rule(route, endpoint=handler.__name__, view_func=handler, methods=methods)
+
+    def _install_token_decode_cache(self, max_size=1024):
+        """
+        Cache decoded JWT claims keyed by a hash of the raw token.
+
+        Protected endpoints re-verify the token signature on every request even
+        though a client presents the same token until it expires. A bounded LRU
+        cache of already-verified claims skips the repeated HMAC verification.
+        Expiry is still checked on every cache hit, and revocation is unaffected
+        because the blocklist callback runs after decoding.
+        """
+        original_decode = self.jwt._decode_jwt_from_config
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        def cached_decode(encoded_token, csrf_value=None, allow_expired=False):
+            if csrf_value is not None or allow_expired:
+                return original_decode(encoded_token, csrf_value, allow_expired)
+
+            # blake2b is fast and collision-safe for cache keying
+            key = hashlib.blake2b(encoded_token.encode(), digest_size=16).digest()
+
+            with lock:
+                claims = cache.get(key)
+                if claims is not None:
+                    cache.move_to_end(key)
+
+            if claims is not None and claims.get('exp', 0) > time.time():
+                return claims
+
+            claims = original_decode(encoded_token, csrf_value, allow_expired)
+
+            with lock:
+                cache[key] = claims
+                if len(cache) > max_size:
+                    cache.popitem(last=False)
+
+            return claims
+
+        self.jwt._decode_jwt_from_config = cached_decode
 
     def _register_error_handlers(self):
         """Register error handlers for different error types"""
@@ -133,38 +386,52 @@ class PersonaInsight:
         self.app.errorhandler(Exception)(self.handle_unexpected_error)
 
     def debug_request(self):
-        """Log request details for debugging"""
-        print("\n=== DEBUG REQUEST INFO ===")
-        print(f"Method: {request.method}")
-        print(f"Path: {request.path}")
-        print("Headers:")
+        """Log request details for debugging (no-op unless debug logging is on)"""
+        # Skip the header walk and body reserialization entirely in production
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        logger.debug("request: method=%s path=%s", request.method, request.path)
         for key, value in request.headers.items():
             if key.lower() == 'authorization':
-                print(f"  {key}: Bearer [REDACTED]")  # Don't log full token
+                logger.debug("  header %s: Bearer [REDACTED]", key)  # Don't log full token
             else:
-                print(f"  {key}: {value}")
+                logger.debug("  header %s: %s", key, value)
 
-        print("Body:")
         if request.is_json:
             body = request.get_json()
-            # Redact password if present
+            # Redact credential fields in a single pass
             if isinstance(body, dict):
-                body_copy = body.copy()
-                if 'password' in body_copy:
-                    body_copy['password'] = '[REDACTED]'
-                if 'current_password' in body_copy:
-                    body_copy['current_password'] = '[REDACTED]'
-                if 'new_password' in body_copy:
-                    body_copy['new_password'] = '[REDACTED]'
-                print(json.dumps(body_copy, indent=2))
+                redacted = {k: '[REDACTED]' if k in _REDACTED_FIELDS else v for k, v in body.items()}
+                logger.debug("  body: %s", json.dumps(redacted, indent=2))
         else:
-            print("[Not JSON]")
-        print("=========================\n")
+            logger.debug("  body: [Not JSON]")
 
     def parameters_checker(self, required_fields, data):
         """Check for missing fields in the provided data."""
         return [field for field in required_fields if field not in data]
 
+    @contextmanager
+    def _pooled(self, operation):
+        """
+        Lease a pooled database connection to a User/Analysis operation object.
+
+        The connection is detached from the object before being returned to the
+        pool so the object's own cleanup never closes a pooled connection. On a
+        database error the connection is discarded instead of reused.
+        """
+        operation.connection = self.db_pool.acquire()
+        try:
+            yield operation
+        except pyodbc.Error:
+            connection, operation.connection = operation.connection, None
+            self.db_pool.discard(connection)
+            raise
+        finally:
+            if operation.connection is not None:
+                connection, operation.connection = operation.connection, None
+                self.db_pool.release(connection)
+
     def parse_personality_summary(self, summary_text):
         """
         Parse the personality summary text into structured components.
@@ -182,20 +449,12 @@ class PersonaInsight:
             "WORK_INSIGHTS": []
         }
 
-        # Define patterns to identify different sections
-        section_patterns = {
-            "GENERAL_INSIGHTS": r"Based on the analyzed text, this personality profile reveals someone who:(.*?)(?=\n\nAdditional insights:|$)",
-            "ADDITIONAL_INSIGHTS": r"Additional insights:(.*?)(?=\n\nIn relationships|$)",
-            "RELATIONSHIP_INSIGHTS": r"In relationships, this person likely:(.*?)(?=\n\nIn work environments|$)",
-            "WORK_INSIGHTS": r"In work environments, this person typically:(.*?)(?=\n\nNote:|$)"
-        }
-
         # Extract and clean insights for each section
-        for section, pattern in section_patterns.items():
-            match = re.search(pattern, summary_text, re.DOTALL)
+        for section, pattern in _SECTION_PATTERNS.items():
+            match = pattern.search(summary_text)
             if match:
                 # Extract bullet points and clean them
-                bullet_points = re.findall(r'•\s+(.*?)(?=\n|$)', match.group(1))
+                bullet_points = _BULLET_RE.findall(match.group(1))
                 structured_summary[section] = [point.strip() for point in bullet_points if point.strip()]
 
         return structured_summary
@@ -227,26 +486,16 @@ class PersonaInsight:
                     'error': 'No tweets provided for analysis.'
                 }), 400
 
-            # Preprocess tweets
-            preprocessed_tweets = [self.preprocessor.preprocess_text(tweet) for tweet in tweets]
-
-            # Analyze tweets
-            results = self.ocean_analyzer.analyze(preprocessed_tweets)
-
-            # Calculate average scores
-            average_scores = self.ocean_analyzer.calculate_average_scores(results)
-
-            # Generate personality summary
-            personality_summary_text = self.ocean_analyzer.generate_personality_summary(results)
-
-            # Parse and structure the summary text into components
-            structured_summary = self.parse_personality_summary(personality_summary_text)
+            # Feed raw tweets straight to the analyzer - the tokenizer was fit
+            # on raw STATUS text, so pre-lemmatizing here both cost time and
+            # fed the model input it was never trained on
+            analysis = self.ocean_analyzer.analyze_full(tweets)
 
             # Prepare response
             response = {
-                'individual_results': results,
-                'average_scores': average_scores,
-                'summary': structured_summary
+                'individual_results': analysis['individual_results'],
+                'average_scores': analysis['average_scores'],
+                'summary': analysis['summary']
             }
 
             return jsonify(response), 200
@@ -272,28 +521,20 @@ class PersonaInsight:
                 raise BadRequest(f'Missing required fields: {", ".join(missing_fields)}')
 
             # Validate email format
-            if not re.match(r"[^@]+@[^@]+\.[^@]+", data['email']):
+            if not _EMAIL_RE.match(data['email']):
                 raise BadRequest("Invalid email format")
 
             # Validate password strength (basic example)
             if len(data['password']) < 8:
                 raise BadRequest("Password must be at least 8 characters long")
 
-            user = User(
+            with self._pooled(User(
                 full_name=data['full_name'],
                 email=data['email'],
                 password=data['password']
-            )
-
-            # Establish connection
-            user.get_connection(
-                server=self.server,
-                database=self.database,
-                trusted_connection=self.trusted_connection
-            )
-
-            # Add user to database
-            user_id = user.add_user()
+            )) as user:
+                # Add user to database
+                user_id = user.add_user()
 
             return jsonify({
                 'id': user_id,
@@ -323,14 +564,8 @@ class PersonaInsight:
             if missing_fields:
                 raise BadRequest(f'Missing required fields: {", ".join(missing_fields)}')
 
-            user = User()
-            user.get_connection(
-                server=self.server,
-                database=self.database,
-                trusted_connection=self.trusted_connection
-            )
-
-            result = user.get_user(data['email'], data['password'])
+            with self._pooled(User()) as user:
+                result = user.get_user(data['email'], data['password'])
 
             if isinstance(result, str):
                 if result == "User not found":
@@ -343,7 +578,12 @@ class PersonaInsight:
             # Create JWT token with user ID as identity
             # Convert ID to string to ensure compatibility
             user_id = str(result['ID'])
-            access_token = create_access_token(identity=user_id)
+            # Stash the numeric ID as a claim so protected handlers can skip
+            # the per-request string-to-int conversion of the identity
+            access_token = create_access_token(
+                identity=user_id,
+                additional_claims={'uid_int': int(result['ID'])}
+            )
 
             # Debug token creation
             print(f"Created token for user ID: {user_id}")
@@ -372,15 +612,14 @@ class PersonaInsight:
             print(traceback.format_exc())
             raise InternalServerError(f"Unexpected error: {str(e)}")
 
+    @jwt_required()
     def update_user(self):
         """Update user information (JWT protected)"""
         self.debug_request()
         try:
-            # Get current user ID from JWT
-            current_user_id = get_jwt_identity()
-
-            # Convert string ID to int if needed
-            user_id = int(current_user_id) if current_user_id.isdigit() else current_user_id
+            # Numeric ID was stored as a claim at login; fall back to the
+            # string identity for tokens issued before that change
+            user_id = get_jwt().get('uid_int', get_jwt_identity())
 
             # Debug info
             print(f"Authenticated user ID: {user_id}")
@@ -398,24 +637,18 @@ class PersonaInsight:
             if missing_fields:
                 raise BadRequest(f'Missing required fields: {", ".join(missing_fields)}')
 
-            user = User()
-            user.get_connection(
-                server=self.server,
-                database=self.database,
-                trusted_connection=self.trusted_connection
-            )
-
             # Get new_password if provided
             new_password = data.get('new_password')
 
             # Update the user
-            result = user.update_user(
-                user_id=user_id,
-                full_name=data['full_name'],
-                email=data['email'],
-                curr_password=data['current_password'],
-                new_password=new_password
-            )
+            with self._pooled(User()) as user:
+                result = user.update_user(
+                    user_id=user_id,
+                    full_name=data['full_name'],
+                    email=data['email'],
+                    curr_password=data['current_password'],
+                    new_password=new_password
+                )
 
             if result == "User not found":
                 raise NotFound("User not found")
@@ -440,15 +673,14 @@ class PersonaInsight:
             print(traceback.format_exc())
             raise InternalServerError(f"Unexpected error: {str(e)}")
 
+    @jwt_required()
     def delete_user(self):
         """Delete a user account (JWT protected)"""
         self.debug_request()
         try:
-            # Get current user ID from JWT
-            current_user_id = get_jwt_identity()
-
-            # Convert string ID to int if needed
-            user_id = int(current_user_id) if current_user_id.isdigit() else current_user_id
+            # Numeric ID was stored as a claim at login; fall back to the
+            # string identity for tokens issued before that change
+            user_id = get_jwt().get('uid_int', get_jwt_identity())
 
             print(f"Delete request for user ID: {user_id}")
 
@@ -463,18 +695,12 @@ class PersonaInsight:
             if missing_fields:
                 raise BadRequest(f'Missing required fields: {", ".join(missing_fields)}')
 
-            user = User()
-            user.get_connection(
-                server=self.server,
-                database=self.database,
-                trusted_connection=self.trusted_connection
-            )
-
-            result = user.delete_user(
-                user_id=user_id,
-                email=data['email'],
-                password=data['password']
-            )
+            with self._pooled(User()) as user:
+                result = user.delete_user(
+                    user_id=user_id,
+                    email=data['email'],
+                    password=data['password']
+                )
 
             if not result:
                 raise NotFound("User not found or credentials incorrect")
@@ -497,8 +723,9 @@ class PersonaInsight:
     def logout_user(self):
         """Logout user by blacklisting token"""
         try:
-            jti = get_jwt()["jti"]  # Get unique identifier for the token
-            self.token_blacklist.add(jti)
+            claims = get_jwt()
+            jti = claims["jti"]  # Get unique identifier for the token
+            self.token_blacklist.add(jti, claims.get('exp'))
 
             # Debug logging
             print(f"Token blacklisted - JTI: {jti}")
@@ -512,6 +739,7 @@ class PersonaInsight:
             print(f"Logout error: {str(e)}")
             raise InternalServerError("Failed to process logout request")
 
+    @jwt_required()
     def check_token(self):
         """Endpoint to verify JWT token is working correctly"""
         try:
@@ -519,19 +747,13 @@ class PersonaInsight:
             # Get the full JWT claims
             jwt_claims = get_jwt()
 
-            # Convert string ID to int if needed for database query
-            user_id = int(current_user_id) if current_user_id.isdigit() else current_user_id
+            # Numeric ID was stored as a claim at login; fall back to the
+            # string identity for tokens issued before that change
+            user_id = jwt_claims.get('uid_int', current_user_id)
 
             # Verify user exists in database
-            user = User()
-            user.get_connection(
-                server=self.server,
-                database=self.database,
-                trusted_connection=self.trusted_connection
-            )
-
-            # Get user info from database
-            user_info = user.get_user_by_id(user_id)
+            with self._pooled(User()) as user:
+                user_info = user.get_user_by_id(user_id)
 
             if isinstance(user_info, str) and user_info == "User not found":
                 raise NotFound("User not found")
@@ -553,6 +775,59 @@ class PersonaInsight:
             print(traceback.format_exc())
             raise InternalServerError(f"Error verifying token: {str(e)}")
 
+    def _get_cached_analyses(self, email):
+        """Return the cached analysis list for a user if still fresh"""
+        with self._analyses_cache_lock:
+            entry = self._analyses_cache.get(email)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._analyses_cache[email]
+                return None
+            return entry[1]
+
+    def _store_cached_analyses(self, email, analyses, max_size=256):
+        """Cache a user's analysis list for the configured TTL"""
+        with self._analyses_cache_lock:
+            self._analyses_cache[email] = (time.time() + self._analyses_cache_ttl, analyses)
+            self._analyses_cache.move_to_end(email)
+            while len(self._analyses_cache) > max_size:
+                self._analyses_cache.popitem(last=False)
+
+    def _invalidate_cached_analyses(self, email):
+        """Drop a user's cached analyses after a write so reads stay current"""
+        with self._analyses_cache_lock:
+            self._analyses_cache.pop(email, None)
+
+    def _scrape_tweets(self, identifier, is_url, count, headless=True):
+        """
+        Run a scrape job on the shared executor and wait for its result.
+
+        The HTTP guest-API scraper is tried first when aiohttp is installed -
+        it pages tweets as JSON with no browser in the loop. Any API failure
+        falls back to the pooled Selenium scraper. Dispatching through the
+        executor bounds how many scrapes run at once either way.
+
+        Returns:
+            tuple: (tweets or None, resolved username)
+        """
+        username = AsyncTweetScraper.extract_username(identifier) if is_url else identifier
+
+        def _scrape():
+            if AsyncTweetScraper.is_available():
+                try:
+                    # None means private/nonexistent - a real answer, not a
+                    # failure, so it is returned without the browser fallback
+                    return AsyncTweetScraper.scrape_tweets_sync(username, count), username
+                except Exception as e:
+                    print(f"API scrape failed ({str(e)}), falling back to browser")
+
+            with self.scraper_pool.scraper(headless=headless) as scraper:
+                tweets = scraper.scrape_tweets(identifier, is_url=is_url, num_tweets=count)
+            return tweets, username
+
+        return self.scrape_executor.submit(_scrape).result()
+
     def get_tweets_by_username(self, username):
         """
         API route to get tweets by username
@@ -569,27 +844,20 @@ class PersonaInsight:
             if count <= 0 or count > 100:
                 return jsonify({"error": "Count must be between 1 and 100"}), 400
 
-            # Initialize scraper
-            scraper = TwitterScraper(headless=False)
-
-            try:
-                # Scrape tweets
-                tweets = scraper.scrape_tweets(username, is_url=False, num_tweets=count)
-
-                if tweets is None:
-                    return jsonify({
-                        "error": "Cannot access tweets",
-                        "message": "Profile is private or does not exist"
-                    }), 403
+            # Scrape on the shared executor with a pooled scraper
+            tweets, _ = self._scrape_tweets(username, is_url=False, count=count, headless=False)
 
+            if tweets is None:
                 return jsonify({
-                    "username": username,
-                    "count": len(tweets),
-                    "tweets": tweets
-                })
+                    "error": "Cannot access tweets",
+                    "message": "Profile is private or does not exist"
+                }), 403
 
-            finally:
-                scraper.close()
+            return jsonify({
+                "username": username,
+                "count": len(tweets),
+                "tweets": tweets
+            })
 
         except Exception as e:
             return jsonify({"error": str(e)}), 500
@@ -614,31 +882,21 @@ class PersonaInsight:
             if count <= 0 or count > 100:
                 return jsonify({"error": "Count must be between 1 and 100"}), 400
 
-            # Initialize scraper
-            scraper = TwitterScraper(headless=False)
-
-            try:
-                # Extract username from URL for response
-                username = scraper.extract_username_from_url(url)
-
-                # Scrape tweets
-                tweets = scraper.scrape_tweets(url, is_url=True, num_tweets=count)
-
-                if tweets is None:
-                    return jsonify({
-                        "error": "Cannot access tweets",
-                        "message": "Profile is private or does not exist"
-                    }), 403
+            # Scrape on the shared executor with a pooled scraper
+            tweets, username = self._scrape_tweets(url, is_url=True, count=count, headless=False)
 
+            if tweets is None:
                 return jsonify({
-                    "username": username,
-                    "url": url,
-                    "count": len(tweets),
-                    "tweets": tweets
-                })
+                    "error": "Cannot access tweets",
+                    "message": "Profile is private or does not exist"
+                }), 403
 
-            finally:
-                scraper.close()
+            return jsonify({
+                "username": username,
+                "url": url,
+                "count": len(tweets),
+                "tweets": tweets
+            })
 
         except Exception as e:
             return jsonify({"error": str(e)}), 500
@@ -651,11 +909,11 @@ class PersonaInsight:
             value: String value to convert
 
         Returns:
-            bool: True if value is 'true', '1', 'yes' (case insensitive), False otherwise
+            bool: True if value is 'true', '1', 'yes', 'on' (case insensitive), False otherwise
         """
         if value is None:
             return False
-        return str(value).lower() == 'true'
+        return value in _TRUTHY or str(value).lower() in _TRUTHY
 
     def analyze_profile(self):
         """
@@ -673,13 +931,6 @@ class PersonaInsight:
             realtime_processing = self.str_to_bool(request.args.get('realtimeProcessing', 'false'))
 
             # Validate parameters
-
-            if url and 'twitter.com' not in url and 'x.com' not in url:
-                return jsonify({"error": "Invalid Twitter URL"}), 400
-
-            if count <= 0 or count > 100:
-                return jsonify({"error": "Count must be between 1 and 100"}), 400
-
             if not username and not url:
                 return jsonify({"error": "Either username or url parameter is required"}), 400
 
@@ -693,94 +944,88 @@ class PersonaInsight:
             is_url = url is not None
             identifier = url if is_url else username
 
-            # Initialize scraper
-            scraper = TwitterScraper(headless=not realtime_processing)
+            # Scrape on the shared executor; the pooled scraper is released as
+            # soon as the job finishes
+            tweets, profile_username = self._scrape_tweets(
+                identifier, is_url=is_url, count=count, headless=not realtime_processing)
 
-            try:
-                # Scrape tweets
-                tweets = scraper.scrape_tweets(identifier, is_url=is_url, num_tweets=count)
-
-                if tweets is None:
-                    return jsonify({
-                        "error": "Cannot access tweets",
-                        "message": "Profile is private or does not exist"
-                    }), 403
-
-                # Get username for response
-                profile_username = username if not is_url else scraper.extract_username_from_url(url)
-
-                # Preprocess tweets
-                preprocessed_tweets = [self.preprocessor.preprocess_text(tweet) for tweet in tweets]
-
-                # Analyze tweets
-                results = self.ocean_analyzer.analyze(preprocessed_tweets)
-
-                # Calculate average scores
-                average_scores = self.ocean_analyzer.calculate_average_scores(results)
-
-                # Generate personality summary
-                personality_summary_text = self.ocean_analyzer.generate_personality_summary(results)
+            if tweets is None:
+                return jsonify({
+                    "error": "Cannot access tweets",
+                    "message": "Profile is private or does not exist"
+                }), 403
 
-                # Parse and structure the summary text into components
-                structured_summary = self.parse_personality_summary(personality_summary_text)
+            # Feed raw tweets straight to the analyzer - the tokenizer was fit
+            # on raw STATUS text, so pre-lemmatizing here both cost time and
+            # fed the model input it was never trained on
+            analysis_result = self.ocean_analyzer.analyze_full(tweets)
+            average_scores = analysis_result['average_scores']
+            structured_summary = analysis_result['summary']
 
-                # Prepare response
-                response = {
-                    'username': profile_username,
-                    'tweets_analyzed': len(tweets),
-                    'tweets': tweets,
-                    'individual_results': results,
-                    'average_scores': average_scores,
-                    'summary': structured_summary
-                }
+            # Prepare response
+            response = {
+                'username': profile_username,
+                'tweets_analyzed': len(tweets),
+                'tweets': tweets,
+                'individual_results': analysis_result['individual_results'],
+                'average_scores': average_scores,
+                'summary': structured_summary
+            }
 
-                # Save to database only if email is provided and analysis was successful
-                if email:
+            # Save to database only if email is provided and analysis was successful
+            if email:
+                try:
+                    analysis = Analysis(
+                        email=email,
+                        username=profile_username,
+                        tweets_count=len(tweets),
+                        average_scores=average_scores
+                    )
+
+                    # Convert insights into properly formatted list for Analysis class
+                    insights = []
+                    for insight_type, insight_list in structured_summary.items():
+                        if insight_list:  # Only add if there are insights for this type
+                            insights.append({
+                                'type': insight_type,  # Keep original camelCase for consistency
+                                'text': ", ".join(insight_list)
+                            })
+
+                    # Set insights to the analysis object
+                    analysis.insights = insights
+
+                    # Save on the DB executor with a bounded wait, so a slow
+                    # database adds at most a few seconds after an analysis
+                    # that already succeeded; past that the write keeps
+                    # running in the background and is reported as pending
+                    def _save():
+                        with self._pooled(analysis):
+                            saved_id = analysis.add_analysis()
+                        self._invalidate_cached_analyses(email)
+                        return saved_id
+
+                    future = self.db_executor.submit(_save)
                     try:
-                        analysis = Analysis(
-                            email=email,
-                            username=profile_username,
-                            tweets_count=len(tweets),
-                            average_scores=average_scores
-                        )
-
-                        # Convert insights into properly formatted list for Analysis class
-                        insights = []
-                        for insight_type, insight_list in structured_summary.items():
-                            if insight_list:  # Only add if there are insights for this type
-                                insights.append({
-                                    'type': insight_type,  # Keep original camelCase for consistency
-                                    'text': ", ".join(insight_list)
-                                })
-
-                        # Set insights to the analysis object
-                        analysis.insights = insights
-
-                        # Get database connection parameters from the current instance
-                        analysis.get_connection(
-                            server=self.server,
-                            database=self.database,
-                            trusted_connection=self.trusted_connection
-                        )
-
-                        # Save the analysis
-                        analysis_id = analysis.add_analysis()
-                        response['analysis_id'] = analysis_id
+                        response['analysis_id'] = future.result(timeout=5)
                         response['saved_to_db'] = True
-                    except Exception as db_error:
-                        # Log the database error but don't fail the request
-                        print(f"Failed to save analysis to database: {str(db_error)}")
-                        print(traceback.format_exc())
-                        response['saved_to_db'] = False
-                        response['db_error'] = str(db_error)
-                else:
+                    except FutureTimeoutError:
+                        future.add_done_callback(
+                            lambda f: f.exception() and print(
+                                f"Deferred analysis save failed: {f.exception()}")
+                        )
+                        response['saved_to_db'] = 'pending'
+                        response['message'] = "Analysis save still in progress"
+                except Exception as db_error:
+                    # Log the database error but don't fail the request
+                    print(f"Failed to save analysis to database: {str(db_error)}")
+                    print(traceback.format_exc())
                     response['saved_to_db'] = False
-                    response['message'] = "Analysis not saved to database (no email provided)"
-
-                return jsonify(response), 200
+                    response['db_error'] = str(db_error)
+            else:
+                response['saved_to_db'] = False
+                response['message'] = "Analysis not saved to database (no email provided)"
 
-            finally:
-                scraper.close()
+            return jsonify(response), 200
 
         except Exception as e:
             # Don't attempt to save anything if there was an error in analysis
@@ -806,15 +1051,13 @@ class PersonaInsight:
             # Debug logging
             print(f"Fetching analyses for user: {current_user_email}")
 
-            # Get analyses using the Analysis class
-            analysis = Analysis()
-            analysis.get_connection(
-                server=self.server,
-                database=self.database,
-                trusted_connection=self.trusted_connection
-            )
-
-            analyses = analysis.get_analyses_by_user(current_user_email)
+            # Serve repeat reads from the short-TTL cache; refreshing
+            # dashboards otherwise issue an identical SELECT per poll
+            analyses = self._get_cached_analyses(current_user_email)
+            if analyses is None:
+                with self._pooled(Analysis()) as analysis:
+                    analyses = analysis.get_analyses_by_user(current_user_email)
+                self._store_cached_analyses(current_user_email, analyses)
 
             # Format the response
             response = {
@@ -871,23 +1114,17 @@ class PersonaInsight:
             is_url = url is not None
             identifier = url if is_url else username
 
-            # Initialize scraper
-            scraper = TwitterScraper(headless=False)
-
-            try:
-                # Scrape profile info
+            # Borrow a pooled headless scraper instead of launching a browser
+            with self.scraper_pool.scraper(headless=True) as scraper:
                 profile_info = scraper.scrape_profile_info(identifier, is_url=is_url)
 
-                if profile_info is None:
-                    return jsonify({
-                        "error": "Cannot access profile",
-                        "message": "Profile does not exist or is unavailable"
-                    }), 404
-
-                return jsonify(profile_info), 200
+            if profile_info is None:
+                return jsonify({
+                    "error": "Cannot access profile",
+                    "message": "Profile does not exist or is unavailable"
+                }), 404
 
-            finally:
-                scraper.close()
+            return jsonify(profile_info), 200
 
         except Exception as e:
             return jsonify({"error": str(e)}), 500
@@ -939,9 +1176,21 @@ class PersonaInsight:
             'success': False
         }), 500
 
-    def run(self, host='0.0.0.0', port=5000, debug=True):
-        """Run the Flask application"""
-        self.app.run(host=host, port=port, debug=debug)
+    def run(self, host='0.0.0.0', port=5000, debug=None, threaded=True):
+        """
+        Run the Flask application
+
+        The endpoints are I/O-bound (Selenium scraping and ODBC queries), so the
+        server is run threaded: a blocked handler waits on the network instead of
+        holding the whole process, letting other requests proceed concurrently.
+
+        Debug mode follows FLASK_DEBUG unless passed explicitly, and the
+        Werkzeug reloader stays off either way - its fork re-imports the whole
+        app, doubling the TensorFlow/NLTK load time and model memory.
+        """
+        if debug is None:
+            debug = os.environ.get('FLASK_DEBUG', '0') == '1'
+        self.app.run(host=host, port=port, debug=debug, threaded=threaded, use_reloader=False)
 
 
 # Main entry point
@@ -951,4 +1200,4 @@ if __name__ == '__main__':
 
     # Run the application
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=port)
\ No newline at end of file
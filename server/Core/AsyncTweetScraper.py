@@ -0,0 +1,336 @@
+"""
+Asynchronous HTTP tweet scraper.
+
+Fetches tweets through Twitter's guest web API instead of driving a browser:
+a guest bearer token is activated once, then the UserTweets GraphQL endpoint
+is paged via its cursor, ~20 tweets per compressed JSON response. Compared to
+the Selenium path this moves no DOM, renders nothing and never sleeps waiting
+for a scroll, so a profile that takes tens of seconds to scrape in a browser
+comes back in a handful of HTTP round-trips.
+
+aiohttp is an optional dependency - callers should check is_available() and
+keep the Selenium scraper as fallback.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# Public bearer token of Twitter's web client, used to activate guest sessions
+_BEARER_TOKEN = (
+    'AAAAAAAAAAAAAAAAAAAAANRILgAAAAAAnNwIzUejRCOuH5E6I8xnZz4puTs'
+    '%3D1Zv7ttfk8LF81IUq16cHjhLTvJu4FA33AGWWjCpTnA'
+)
+
+_ACTIVATE_URL = 'https://api.twitter.com/1.1/guest/activate.json'
+_GRAPHQL_BASE = 'https://twitter.com/i/api/graphql'
+_USER_BY_SCREEN_NAME = 'G3KGOASz96M-Qu0nwmGXNg/UserByScreenName'
+_USER_TWEETS = 'HuTx74BxAnezK1gWvYY7zg/UserTweets'
+
+_USERNAME_RE = re.compile(r'(?:https?:\/\/)?(?:www\.)?(?:twitter\.com|x\.com)\/([^\/?\s]+)')
+
+# Process-wide guest token shared across scraper instances. Activation costs
+# ~200ms and one token happily serves hundreds of requests, so the second and
+# later profiles skip the handshake entirely. Refreshed well before Twitter's
+# actual expiry.
+_TOKEN_TTL = 1500
+_TOKEN_CACHE = {'token': None, 'exp': 0.0}
+
+
+def is_available():
+    """Whether the HTTP scraping path can be used in this environment"""
+    return aiohttp is not None
+
+
+def extract_username(identifier):
+    """Extract a bare username from a profile URL or @-prefixed handle"""
+    match = _USERNAME_RE.search(identifier)
+    if match:
+        return match.group(1).split('?')[0]
+    return identifier.strip().lstrip('@')
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter awaited before each API request.
+
+    Keeps a batch scrape under Twitter's per-guest-token rate limits instead
+    of blasting requests and eating 429 backoffs.
+    """
+
+    def __init__(self, rate=5.0, burst=10):
+        """
+        Args:
+            rate (float): Sustained requests per second
+            burst (int): Extra requests allowed to go out immediately
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request token is available"""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1.0:
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+                self._tokens = 0.0
+            else:
+                self._tokens -= 1.0
+
+
+class AsyncTwitterScraper:
+    """Guest-API tweet scraper built on aiohttp"""
+
+    def __init__(self, max_connections=64, timeout=15, rate_limiter=None):
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required for AsyncTwitterScraper")
+        self.max_connections = max_connections
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.rate_limiter = rate_limiter
+        self._session = None
+        self._guest_token = None
+
+    async def _get_session(self):
+        """Create the shared HTTP session on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=self.max_connections)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _activate_guest_token(self):
+        """Reuse the cached guest token, activating a fresh one only on expiry"""
+        if time.time() < _TOKEN_CACHE['exp']:
+            self._guest_token = _TOKEN_CACHE['token']
+            return
+
+        session = await self._get_session()
+        async with session.post(
+                _ACTIVATE_URL,
+                headers={'Authorization': f'Bearer {_BEARER_TOKEN}'}) as resp:
+            resp.raise_for_status()
+            data = await resp.json()
+        self._guest_token = data['guest_token']
+        _TOKEN_CACHE['token'] = self._guest_token
+        _TOKEN_CACHE['exp'] = time.time() + _TOKEN_TTL
+
+    async def _headers(self):
+        """Request headers carrying the bearer and an activated guest token"""
+        if self._guest_token is None:
+            await self._activate_guest_token()
+        return {
+            'Authorization': f'Bearer {_BEARER_TOKEN}',
+            'x-guest-token': self._guest_token,
+            'Content-Type': 'application/json',
+        }
+
+    async def _graphql_get(self, query, variables):
+        """
+        Issue a GraphQL GET with token refresh and backoff.
+
+        Expired guest tokens (401/403) are refreshed once; rate limits (429)
+        and server errors back off exponentially, honoring the
+        x-rate-limit-reset header when present.
+        """
+        session = await self._get_session()
+        url = f"{_GRAPHQL_BASE}/{query}"
+        params = {'variables': json.dumps(variables, separators=(',', ':'))}
+
+        backoff = 1.0
+        refreshed = False
+        for attempt in range(4):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+
+            async with session.get(url, params=params, headers=await self._headers()) as resp:
+                if resp.status in (401, 403) and not refreshed:
+                    # Guest tokens expire; drop the shared cache too so other
+                    # instances don't keep replaying the dead token
+                    self._guest_token = None
+                    _TOKEN_CACHE['exp'] = 0.0
+                    refreshed = True
+                    continue
+
+                if (resp.status == 429 or resp.status >= 500) and attempt < 3:
+                    delay = backoff
+                    reset = resp.headers.get('x-rate-limit-reset')
+                    if reset and reset.isdigit():
+                        delay = max(min(int(reset) - time.time(), 60.0), backoff)
+                    await asyncio.sleep(delay)
+                    backoff *= 2
+                    continue
+
+                resp.raise_for_status()
+                return await resp.json()
+
+    async def get_user(self, username):
+        """
+        Resolve a username to its numeric ID and protection status
+
+        Returns:
+            tuple: (rest_id, is_protected), or (None, False) if not found
+        """
+        data = await self._graphql_get(_USER_BY_SCREEN_NAME, {
+            'screen_name': username,
+            'withSafetyModeUserFields': True,
+        })
+        result = (data.get('data', {}).get('user') or {}).get('result')
+        if not result or not result.get('rest_id'):
+            return None, False
+        protected = bool(result.get('legacy', {}).get('protected'))
+        return result['rest_id'], protected
+
+    async def scrape_tweets(self, username, num_tweets):
+        """
+        Collect up to num_tweets tweet texts from a user's timeline
+
+        Pages the UserTweets endpoint by cursor until enough tweets are
+        collected or the timeline runs out.
+
+        Returns:
+            Optional[List[str]]: Tweet texts, or None if the profile is
+            private or does not exist (matching TwitterScraper semantics)
+        """
+        user_id, protected = await self.get_user(username)
+        if user_id is None or protected:
+            return None
+
+        tweets = []
+        cursor = None
+        # Each page yields ~20 tweets; cap pages defensively like the
+        # Selenium scraper caps scroll attempts
+        for _ in range(max(num_tweets // 10, 5)):
+            variables = {
+                'userId': user_id,
+                'count': min(max(num_tweets, 20), 100),
+                'includePromotedContent': False,
+                'withVoice': False,
+            }
+            if cursor:
+                variables['cursor'] = cursor
+
+            data = await self._graphql_get(_USER_TWEETS, variables)
+            texts, cursor = self._extract_tweets(data)
+
+            tweets.extend(texts)
+            if len(tweets) >= num_tweets or not cursor or not texts:
+                break
+
+        return tweets[:num_tweets]
+
+    @staticmethod
+    def _extract_tweets(data):
+        """Pull tweet texts and the next cursor out of a UserTweets response"""
+        texts = []
+        next_cursor = None
+
+        instructions = (
+            data.get('data', {})
+            .get('user', {})
+            .get('result', {})
+            .get('timeline_v2', {})
+            .get('timeline', {})
+            .get('instructions', [])
+        )
+
+        for instruction in instructions:
+            for entry in instruction.get('entries', []):
+                content = entry.get('content', {})
+
+                if content.get('entryType') == 'TimelineTimelineItem':
+                    result = (
+                        content.get('itemContent', {})
+                        .get('tweet_results', {})
+                        .get('result', {})
+                    )
+                    full_text = result.get('legacy', {}).get('full_text')
+                    if full_text:
+                        texts.append(full_text)
+
+                elif content.get('entryType') == 'TimelineTimelineCursor':
+                    if content.get('cursorType') == 'Bottom':
+                        next_cursor = content.get('value')
+
+        return texts, next_cursor
+
+
+async def scrape_many(identifiers, num_tweets, max_concurrency=16):
+    """
+    Scrape several profiles concurrently over one shared session
+
+    A BoundedSemaphore caps in-flight profiles and a shared RateLimiter keeps
+    the combined request rate under the guest-token limits, so N profiles cost
+    roughly one profile's wall-clock time instead of N.
+
+    Args:
+        identifiers (list): Profile URLs or usernames
+        num_tweets (int): Tweets to collect per profile
+        max_concurrency (int): Maximum profiles scraped at once
+
+    Returns:
+        dict: username -> tweet list (None for private/missing/failed profiles)
+    """
+    usernames = [extract_username(identifier) for identifier in identifiers]
+    semaphore = asyncio.BoundedSemaphore(max_concurrency)
+
+    async with AsyncTwitterScraper(rate_limiter=RateLimiter()) as scraper:
+        async def _one(username):
+            async with semaphore:
+                try:
+                    return await scraper.scrape_tweets(username, num_tweets)
+                except Exception as e:
+                    logger.warning("Scrape failed for %s: %s", username, str(e))
+                    return None
+
+        results = await asyncio.gather(*(_one(username) for username in usernames))
+
+    return dict(zip(usernames, results))
+
+
+def scrape_many_sync(identifiers, num_tweets, max_concurrency=16):
+    """
+    Synchronous wrapper around scrape_many
+
+    Returns:
+        dict: Same contract as scrape_many
+    """
+    return asyncio.run(scrape_many(identifiers, num_tweets, max_concurrency))
+
+
+def scrape_tweets_sync(username, num_tweets):
+    """
+    Synchronous wrapper for callers that live in a thread, not an event loop
+
+    Returns:
+        Optional[List[str]]: Same contract as AsyncTwitterScraper.scrape_tweets
+    """
+    async def _run():
+        async with AsyncTwitterScraper() as scraper:
+            return await scraper.scrape_tweets(username, num_tweets)
+
+    return asyncio.run(_run())
